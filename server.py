@@ -7,23 +7,216 @@ IMPORTANT: This viewer is READ-ONLY. It never writes to or modifies history file
 Backups are copied to a separate directory within this app's folder.
 """
 
+from __future__ import annotations
+
+import gzip
+import hashlib
 import http.server
+import io
 import json
 import os
+import re
 import shutil
-import socketserver
+import sys
+import threading
 import webbrowser
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used otherwise
+    orjson = None
+
 PORT = 8547
 CLAUDE_DIR = Path.home() / ".claude" / "projects"
 BACKUP_DIR = Path(__file__).parent / "backups"
+SCAN_WORKERS = 8
+GZIP_LEVEL = 1
+GZIP_MIN_SIZE = 1024
+
+# Resolved once; every client-supplied session path must fall inside it
+_CLAUDE_ROOT = CLAUDE_DIR.resolve()
+
+# Per-file session summaries keyed by path, invalidated when (mtime_ns, size) changes.
+# A summary of None marks a file with no messages so it is skipped without re-reading.
+_SESSION_META_CACHE: dict[str, tuple[int, int, dict[str, Any] | None]] = {}
+_SESSION_META_CACHE_LOCK = threading.Lock()
+
+# Session counts of backup zips keyed by path, as (mtime_ns, size, count)
+_BACKUP_COUNT_CACHE: dict[str, tuple[int, int, int]] = {}
+_BACKUP_COUNT_CACHE_LOCK = threading.Lock()
+
+# Fixed parts of every JSON API response head (status line matches the handler's HTTP/1.0)
+_JSON_STATUS_LINE = b"HTTP/1.0 200 OK\r\n"
+_JSON_RESPONSE_HEADERS = (
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: http://localhost:8547\r\n"
+    b"Vary: Accept-Encoding\r\n"
+)
+
+# os.sendfile accepts regular files as the destination only on Linux
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+# Cheap pre-check, independent of key order: a line can only be a message if this appears
+# somewhere in it. Matching lines are still decoded to confirm the top-level "type".
+_MESSAGE_TYPE_HINT_RE = re.compile(rb'"type"\s*:\s*"(?:user|assistant)"')
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON, using orjson when available (raises json.JSONDecodeError either way)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode JSON straight to UTF-8 bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _json_dumps_line(data: Any) -> bytes:
+    """Encode JSON followed by a newline (one NDJSON record)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode() + b"\n"
+
+
+def _safe_session_path(path: str) -> Path | None:
+    """Resolve a client-supplied path, or None if it is invalid or outside CLAUDE_DIR"""
+    try:
+        requested_path = Path(path).resolve()
+    except (OSError, RuntimeError, ValueError):
+        return None
+    if not requested_path.is_relative_to(_CLAUDE_ROOT):
+        return None
+    return requested_path
+
+
+def _iter_sessions(root: Path) -> Iterator[os.DirEntry]:
+    """Walk root for session .jsonl files, pruning subagents/ directories without entering them"""
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip subagent files for cleaner list
+                        if entry.name != "subagents":
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".jsonl") and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _stat_sessions(root: Path) -> list[tuple[Path, os.stat_result]]:
+    """Collect (path, stat) for every session file under root"""
+    files = []
+    for entry in _iter_sessions(root):
+        try:
+            files.append((Path(entry.path), entry.stat()))
+        except OSError:
+            continue
+    return files
+
+
+def _sessions_etag(files: list[tuple[Path, os.stat_result]]) -> str:
+    """Weak ETag that changes whenever a session file is added, removed or modified"""
+    digest = hashlib.blake2b(digest_size=8)
+    for path, stat in sorted(files):
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file and its metadata, in-kernel via os.sendfile where available"""
+    if not _USE_SENDFILE:
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        offset = 0
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except OSError:
+            # Some filesystems reject sendfile (EINVAL, ENOSYS, ENOTSUP); finish with a plain copy
+            pass
+        # Copy whatever sendfile didn't, including anything appended since the fstat
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _summarize_session(jsonl_file: Path) -> dict[str, Any] | None:
+    """Build the session list entry for a JSONL file, or None if it has no messages.
+
+    Read errors propagate so the caller can tell them apart from an empty session.
+    """
+    # Get first user message for preview
+    preview = ""
+    timestamp = None
+    message_count = 0
+    cwd = ""
+
+    # Stream the file read-only through a 64 KB buffer instead of loading it whole
+    with jsonl_file.open("rb", buffering=1 << 16) as f:
+        for line in f:
+            # Skip decoding lines that can't be messages (snapshots, summaries, blanks)
+            if not _MESSAGE_TYPE_HINT_RE.search(line):
+                continue
+            try:
+                obj = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if obj.get("type") == "user":
+                message_count += 1
+                if not preview and obj.get("message", {}).get("content"):
+                    msg_content = obj["message"]["content"]
+                    if isinstance(msg_content, str):
+                        preview = msg_content[:100]
+                if not timestamp:
+                    timestamp = obj.get("timestamp")
+                if not cwd:
+                    cwd = obj.get("cwd", "")
+            elif obj.get("type") == "assistant":
+                message_count += 1
+
+    # Only include sessions with at least 1 message
+    if message_count == 0:
+        return None
+
+    return {
+        "path": str(jsonl_file),
+        "name": jsonl_file.name,
+        "preview": preview,
+        "timestamp": timestamp,
+        "messageCount": message_count,
+        "cwd": cwd
+    }
+
 
 class HistoryHandler(http.server.SimpleHTTPRequestHandler):
+    # (etag, encoded body) of the last /api/sessions response, shared across requests
+    _sessions_response: tuple[str, bytes] | None = None
+
+    # Set TCP_NODELAY so small streamed NDJSON records aren't held back by Nagle's algorithm
+    disable_nagle_algorithm = True
+
     def __init__(self, *args, **kwargs):
         # Serve from dist/ if it exists (production build), otherwise script's directory
         script_dir = Path(__file__).parent
@@ -32,141 +225,139 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
         super().__init__(*args, directory=serve_dir, **kwargs)
 
     def do_DELETE(self):
-        parsed = urlparse(self.path)
-
-        # API: Delete a session
-        if parsed.path == "/api/session":
-            params = parse_qs(parsed.query)
-            if "path" in params:
-                self.send_json(self.delete_session(params["path"][0]))
-                return
-            self.send_error(400, "Missing path parameter")
-            return
-
-        self.send_error(404, "Not Found")
+        if not self.dispatch("DELETE"):
+            self.send_error(404, "Not Found")
 
     def do_POST(self):
-        parsed = urlparse(self.path)
-
-        # API: Backup sessions
-        if parsed.path == "/api/backup":
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8') if content_length else '{}'
-            try:
-                params = json.loads(body)
-            except json.JSONDecodeError:
-                params = {}
-            self.send_json(self.backup_sessions(params.get('paths', [])))
-            return
-
-        self.send_error(404, "Not Found")
+        if not self.dispatch("POST"):
+            self.send_error(404, "Not Found")
 
     def do_GET(self):
-        parsed = urlparse(self.path)
+        if not self.dispatch("GET"):
+            # Serve static files
+            super().do_GET()
 
-        # API: List all sessions
-        if parsed.path == "/api/sessions":
+    def dispatch(self, method: str) -> bool:
+        """Handle an API request via _ROUTES; returns False if no route matches"""
+        parsed = urlparse(self.path)
+        route = self._ROUTES.get((method, parsed.path))
+        if route is None:
+            return False
+        route(self, parse_qs(parsed.query) if parsed.query else {})
+        return True
+
+    def api_sessions(self, params: dict[str, list[str]]) -> None:
+        """API: List all sessions (304 if no session file changed since the client's copy)"""
+        if not CLAUDE_DIR.exists():
             self.send_json(self.list_sessions())
             return
 
-        # API: Get session content
-        if parsed.path == "/api/session":
-            params = parse_qs(parsed.query)
-            if "path" in params:
-                session_path = params["path"][0]
-                self.send_json(self.get_session(session_path))
-                return
-            self.send_error(400, "Missing path parameter")
+        files = _stat_sessions(CLAUDE_DIR)
+        etag = _sessions_etag(files)
+        cached = HistoryHandler._sessions_response
+        if cached is None or cached[0] != etag:
+            cached = (etag, _json_dumps(self.list_sessions(files)))
+            HistoryHandler._sessions_response = cached
+        self.send_json_payload(cached[1], etag=etag)
+
+    def api_session(self, params: dict[str, list[str]]) -> None:
+        """API: Get session content"""
+        if "path" in params:
+            self.send_json(self.get_session(params["path"][0]))
             return
+        self.send_error(400, "Missing path parameter")
 
-        # API: Backup all sessions
-        if parsed.path == "/api/backup-all":
-            self.send_json(self.backup_all_sessions())
+    def api_delete_session(self, params: dict[str, list[str]]) -> None:
+        """API: Delete a session"""
+        if "path" in params:
+            self.send_json(self.delete_session(params["path"][0]))
             return
+        self.send_error(400, "Missing path parameter")
 
-        # API: Get backup status
-        if parsed.path == "/api/backup-status":
-            self.send_json(self.get_backup_status())
+    def api_backup(self, params: dict[str, list[str]]) -> None:
+        """API: Backup sessions (paths are read from the JSON body)"""
+        content_length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(content_length) if content_length else b'{}'
+        try:
+            body_params = _json_loads(body)
+        except json.JSONDecodeError:
+            body_params = {}
+        self.send_json(self.backup_sessions(body_params.get('paths', [])))
+
+    def api_backup_all(self, params: dict[str, list[str]]) -> None:
+        """API: Backup all sessions"""
+        self.send_json(self.backup_all_sessions())
+
+    def api_backup_status(self, params: dict[str, list[str]]) -> None:
+        """API: Get backup status"""
+        self.send_json(self.get_backup_status())
+
+    def api_load_backup(self, params: dict[str, list[str]]) -> None:
+        """API: Load sessions from a backup zip (for viewing)"""
+        if "name" in params:
+            self.send_ndjson(self.load_backup(params["name"][0]))
             return
-
-        # API: Load sessions from a backup zip (for viewing)
-        if parsed.path == "/api/load-backup":
-            params = parse_qs(parsed.query)
-            if "name" in params:
-                self.send_json(self.load_backup(params["name"][0]))
-                return
-            self.send_error(400, "Missing name parameter")
+        self.send_error(400, "Missing name parameter")
+
+    def api_restore_session(self, params: dict[str, list[str]]) -> None:
+        """API: Restore a session from backup to Claude history"""
+        if "backup" in params and "session" in params:
+            self.send_json(self.restore_session_from_backup(
+                params["backup"][0],
+                params["session"][0]
+            ))
             return
-
-        # API: Restore a session from backup to Claude history
-        if parsed.path == "/api/restore-session":
-            params = parse_qs(parsed.query)
-            if "backup" in params and "session" in params:
-                self.send_json(self.restore_session_from_backup(
-                    params["backup"][0],
-                    params["session"][0]
-                ))
-                return
-            self.send_error(400, "Missing backup or session parameter")
-            return
-
-        # Serve static files
-        super().do_GET()
-
-    def list_sessions(self) -> dict[str, Any]:
+        self.send_error(400, "Missing backup or session parameter")
+
+    _ROUTES: dict[tuple[str, str], Callable[["HistoryHandler", dict[str, list[str]]], None]] = {
+        ("GET", "/api/sessions"): api_sessions,
+        ("GET", "/api/session"): api_session,
+        ("DELETE", "/api/session"): api_delete_session,
+        ("POST", "/api/backup"): api_backup,
+        ("GET", "/api/backup-all"): api_backup_all,
+        ("GET", "/api/backup-status"): api_backup_status,
+        ("GET", "/api/load-backup"): api_load_backup,
+        ("GET", "/api/restore-session"): api_restore_session,
+    }
+
+    def list_sessions(self, files: list[tuple[Path, os.stat_result]] | None = None) -> dict[str, Any]:
         """List all JSONL session files (READ-ONLY operation)"""
-        sessions = []
-
         if not CLAUDE_DIR.exists():
             return {"error": f"Claude directory not found: {CLAUDE_DIR}", "sessions": []}
 
-        for jsonl_file in CLAUDE_DIR.rglob("*.jsonl"):
-            # Skip subagent files for cleaner list
-            if "/subagents/" in str(jsonl_file):
-                continue
+        if files is None:
+            files = _stat_sessions(CLAUDE_DIR)
 
-            try:
-                # Get first user message for preview
-                preview = ""
-                timestamp = None
-                message_count = 0
-                cwd = ""
-
-                # Read entire file at once and close immediately to avoid holding file handle
-                # This prevents any interference with Claude Code's file operations
-                content = jsonl_file.read_text(encoding="utf-8")
-                for line in content.splitlines():
-                    if not line.strip():
-                        continue
-                    try:
-                        obj = json.loads(line)
-                        if obj.get("type") == "user":
-                            message_count += 1
-                            if not preview and obj.get("message", {}).get("content"):
-                                msg_content = obj["message"]["content"]
-                                if isinstance(msg_content, str):
-                                    preview = msg_content[:100]
-                            if not timestamp:
-                                timestamp = obj.get("timestamp")
-                            if not cwd:
-                                cwd = obj.get("cwd", "")
-                        elif obj.get("type") == "assistant":
-                            message_count += 1
-                    except json.JSONDecodeError:
-                        continue
-
-                # Only include sessions with at least 1 message
-                if message_count > 0:
-                    sessions.append({
-                        "path": str(jsonl_file),
-                        "name": jsonl_file.name,
-                        "preview": preview,
-                        "timestamp": timestamp,
-                        "messageCount": message_count,
-                        "cwd": cwd
-                    })
-            except Exception as e:
-                continue
+        # Reuse cached summaries for files unchanged since they were last read
+        sessions = []
+        changed = []
+        with _SESSION_META_CACHE_LOCK:
+            for jsonl_file, stat in files:
+                cached = _SESSION_META_CACHE.get(str(jsonl_file))
+                if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    if cached[2] is not None:
+                        sessions.append(cached[2])
+                else:
+                    changed.append((jsonl_file, stat))
+
+            # Drop cache entries for files that no longer exist
+            for stale in _SESSION_META_CACHE.keys() - {str(f) for f, _ in files}:
+                del _SESSION_META_CACHE[stale]
+
+        # Summarize new or modified files in parallel (mostly I/O bound)
+        if changed:
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                futures = [executor.submit(_summarize_session, f) for f, _ in changed]
+            for (jsonl_file, stat), future in zip(changed, futures):
+                try:
+                    summary = future.result()
+                except Exception:
+                    # Not cached, so a transient read error is retried on the next request
+                    continue
+                with _SESSION_META_CACHE_LOCK:
+                    _SESSION_META_CACHE[str(jsonl_file)] = (stat.st_mtime_ns, stat.st_size, summary)
+                if summary is not None:
+                    sessions.append(summary)
 
         # Sort by timestamp, newest first
         sessions.sort(key=lambda x: x.get("timestamp") or "", reverse=True)
@@ -176,41 +367,38 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
     def get_session(self, path: str) -> dict[str, Any]:
         """Get contents of a session file with security filtering (READ-ONLY operation)"""
         # Security: Ensure path is within CLAUDE_DIR
-        try:
-            requested_path = Path(path).resolve()
-            if not str(requested_path).startswith(str(CLAUDE_DIR.resolve())):
-                return {"error": "Access denied: Path outside allowed directory"}
-        except Exception:
-            return {"error": "Invalid path"}
+        requested_path = _safe_session_path(path)
+        if requested_path is None:
+            return {"error": "Access denied: Path outside allowed directory"}
 
         if not requested_path.exists():
             return {"error": "Session file not found"}
 
         messages = []
         try:
-            # Read entire file at once and close immediately to avoid holding file handle
-            # This prevents any interference with Claude Code's file operations
-            content = requested_path.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if obj.get("type") in ("user", "assistant"):
-                        # Filter out sensitive fields we don't need
-                        filtered = {
-                            "type": obj.get("type"),
-                            "message": obj.get("message"),
-                            "timestamp": obj.get("timestamp"),
-                            "uuid": obj.get("uuid"),
-                            "sessionId": obj.get("sessionId"),
-                            "cwd": obj.get("cwd"),
-                            "version": obj.get("version"),
-                            "gitBranch": obj.get("gitBranch")
-                        }
-                        messages.append(filtered)
-                except json.JSONDecodeError:
-                    continue
+            # Stream the file read-only through a 64 KB buffer instead of loading it whole
+            with requested_path.open("rb", buffering=1 << 16) as f:
+                for line in f:
+                    # Skip decoding lines that can't be messages (summaries, progress, blanks)
+                    if not _MESSAGE_TYPE_HINT_RE.search(line):
+                        continue
+                    try:
+                        obj = _json_loads(line)
+                        if obj.get("type") in ("user", "assistant"):
+                            # Filter out sensitive fields we don't need
+                            filtered = {
+                                "type": obj.get("type"),
+                                "message": obj.get("message"),
+                                "timestamp": obj.get("timestamp"),
+                                "uuid": obj.get("uuid"),
+                                "sessionId": obj.get("sessionId"),
+                                "cwd": obj.get("cwd"),
+                                "version": obj.get("version"),
+                                "gitBranch": obj.get("gitBranch")
+                            }
+                            messages.append(filtered)
+                    except json.JSONDecodeError:
+                        continue
         except Exception as e:
             return {"error": f"Failed to read session: {str(e)}"}
 
@@ -219,12 +407,9 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
     def delete_session(self, path: str) -> dict[str, Any]:
         """Delete a session file (PERMANENTLY removes the file)"""
         # Security: Ensure path is within CLAUDE_DIR
-        try:
-            requested_path = Path(path).resolve()
-            if not str(requested_path).startswith(str(CLAUDE_DIR.resolve())):
-                return {"error": "Access denied: Path outside allowed directory"}
-        except Exception:
-            return {"error": "Invalid path"}
+        requested_path = _safe_session_path(path)
+        if requested_path is None:
+            return {"error": "Access denied: Path outside allowed directory"}
 
         if not requested_path.exists():
             return {"error": "Session file not found"}
@@ -243,8 +428,8 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
 
         for path in paths:
             try:
-                requested_path = Path(path).resolve()
-                if not str(requested_path).startswith(str(CLAUDE_DIR.resolve())):
+                requested_path = _safe_session_path(path)
+                if requested_path is None:
                     errors.append({"path": path, "error": "Access denied"})
                     continue
 
@@ -253,12 +438,12 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
                     continue
 
                 # Create backup with timestamp and original structure hint
-                rel_path = requested_path.relative_to(CLAUDE_DIR)
+                rel_path = requested_path.relative_to(_CLAUDE_ROOT)
                 backup_name = f"{rel_path.parent.name}_{requested_path.stem}.jsonl"
                 backup_path = BACKUP_DIR / backup_name
 
                 # Copy file
-                shutil.copy2(requested_path, backup_path)
+                _copy_file(requested_path, backup_path)
                 backed_up.append({"original": str(requested_path), "backup": str(backup_path)})
 
             except Exception as e:
@@ -283,18 +468,16 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
         errors = []
 
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for jsonl_file in CLAUDE_DIR.rglob("*.jsonl"):
-                    # Skip subagent files
-                    if "/subagents/" in str(jsonl_file):
-                        continue
+            # Level 1 keeps most of the ratio on repetitive JSONL at a fraction of the CPU cost
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                for entry in _iter_sessions(CLAUDE_DIR):
                     try:
                         # Use relative path within the zip
-                        rel_path = jsonl_file.relative_to(CLAUDE_DIR)
-                        zf.write(jsonl_file, rel_path)
+                        rel_path = Path(entry.path).relative_to(CLAUDE_DIR)
+                        zf.write(entry.path, rel_path)
                         backed_up.append(str(rel_path))
                     except Exception as e:
-                        errors.append({"path": str(jsonl_file), "error": str(e)})
+                        errors.append({"path": entry.path, "error": str(e)})
 
             # Get final zip size
             zip_size = zip_path.stat().st_size
@@ -320,14 +503,29 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
         backups = []
         total_size = 0
 
-        for backup_file in BACKUP_DIR.glob("*.zip"):
+        backup_files = list(BACKUP_DIR.glob("*.zip"))
+
+        # Drop cached counts for archives that no longer exist
+        with _BACKUP_COUNT_CACHE_LOCK:
+            for stale in _BACKUP_COUNT_CACHE.keys() - {str(f) for f in backup_files}:
+                del _BACKUP_COUNT_CACHE[stale]
+
+        for backup_file in backup_files:
             stat = backup_file.stat()
-            # Count sessions in zip
-            try:
-                with zipfile.ZipFile(backup_file, 'r') as zf:
-                    session_count = len([n for n in zf.namelist() if n.endswith('.jsonl')])
-            except:
-                session_count = 0
+            # Count sessions in zip, only reopening archives that changed since the last count
+            cache_key = str(backup_file)
+            with _BACKUP_COUNT_CACHE_LOCK:
+                cached = _BACKUP_COUNT_CACHE.get(cache_key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                session_count = cached[2]
+            else:
+                try:
+                    with zipfile.ZipFile(backup_file, 'r') as zf:
+                        session_count = sum(1 for n in zf.namelist() if n.endswith('.jsonl'))
+                    with _BACKUP_COUNT_CACHE_LOCK:
+                        _BACKUP_COUNT_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, session_count)
+                except (OSError, zipfile.BadZipFile):
+                    session_count = 0
 
             backups.append({
                 "name": backup_file.name,
@@ -377,49 +575,52 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
         except Exception as e:
             return {"error": str(e)}
 
-    def load_backup(self, backup_name: str) -> dict[str, Any]:
-        """Load sessions from a backup zip file"""
+    def load_backup(self, backup_name: str) -> Iterator[dict[str, Any]]:
+        """Yield sessions from a backup zip file one at a time (errors are yielded as records)"""
         if not backup_name or '..' in backup_name:
-            return {"error": "Invalid backup name"}
+            yield {"error": "Invalid backup name"}
+            return
 
         backup_path = BACKUP_DIR / backup_name
         if not backup_path.exists() or not backup_path.suffix == '.zip':
-            return {"error": "Backup not found"}
+            yield {"error": "Backup not found"}
+            return
 
-        sessions = []
         try:
             with zipfile.ZipFile(backup_path, 'r') as zf:
                 for name in zf.namelist():
                     if not name.endswith('.jsonl'):
                         continue
                     try:
-                        content = zf.read(name).decode('utf-8')
-                        lines = content.strip().split('\n')
-
                         # Parse to get preview and metadata
                         messages = []
                         preview = ""
                         timestamp = None
                         cwd = None
 
-                        for line in lines:
-                            try:
-                                obj = json.loads(line)
-                                if obj.get('type') in ('user', 'assistant'):
-                                    messages.append(obj)
-                                    if not preview and obj.get('type') == 'user':
-                                        content_val = obj.get('message', {}).get('content', '')
-                                        if isinstance(content_val, str):
-                                            preview = content_val[:100]
-                                    if not timestamp and obj.get('timestamp'):
-                                        timestamp = obj['timestamp']
-                                    if not cwd and obj.get('cwd'):
-                                        cwd = obj['cwd']
-                            except:
-                                continue
-
+                        # Decompress and parse line by line instead of reading the whole entry
+                        with zf.open(name) as fp:
+                            for line in io.BufferedReader(fp, buffer_size=1 << 16):
+                                if not line.strip():
+                                    continue
+                                try:
+                                    obj = _json_loads(line)
+                                    if obj.get('type') in ('user', 'assistant'):
+                                        messages.append(obj)
+                                        if not preview and obj.get('type') == 'user':
+                                            content_val = obj.get('message', {}).get('content', '')
+                                            if isinstance(content_val, str):
+                                                preview = content_val[:100]
+                                        if not timestamp and obj.get('timestamp'):
+                                            timestamp = obj['timestamp']
+                                        if not cwd and obj.get('cwd'):
+                                            cwd = obj['cwd']
+                                except:
+                                    continue
+
+                        # Sessions are sorted by the client as they arrive
                         if messages:
-                            sessions.append({
+                            yield {
                                 "name": name,
                                 "path": f"backup:{backup_name}:{name}",
                                 "preview": preview,
@@ -427,43 +628,129 @@ class HistoryHandler(http.server.SimpleHTTPRequestHandler):
                                 "cwd": cwd,
                                 "messageCount": len(messages),
                                 "messages": messages  # Include full messages
-                            })
+                            }
                     except Exception as e:
                         continue
 
-            sessions.sort(key=lambda x: x.get('timestamp') or '', reverse=True)
-            return {"sessions": sessions, "backup_name": backup_name}
-
         except Exception as e:
-            return {"error": str(e)}
+            yield {"error": str(e)}
+
+    def accepts_gzip(self) -> bool:
+        """Check whether Accept-Encoding allows gzip (an explicit or wildcard coding with q > 0)"""
+        qualities = {}
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            name, *params = coding.split(";")
+            quality = 1.0
+            for param in params:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[name.strip().lower()] = quality
+
+        for name in ("gzip", "x-gzip", "*"):
+            if name in qualities:
+                return qualities[name] > 0
+        return False
 
     def send_json(self, data: dict[str, Any]) -> None:
-        """Send JSON response"""
+        """Send JSON response, gzip-compressed when the client supports it"""
+        self.send_json_payload(_json_dumps(data))
+
+    def send_json_payload(self, payload: bytes, etag: str | None = None) -> None:
+        """Send already-encoded JSON, or 304 Not Modified if the client's ETag still matches"""
+        if etag is not None:
+            client_etags = [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]
+            if etag in client_etags:
+                # Same validators and caching headers as the 200 response
+                self.send_response(304)
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                return
+
+        gzipped = len(payload) >= GZIP_MIN_SIZE and self.accepts_gzip()
+        if gzipped:
+            payload = gzip.compress(payload, compresslevel=GZIP_LEVEL)
+
+        # Assemble the head by hand and send it with the body in a single write
+        response = [
+            _JSON_STATUS_LINE,
+            b"Server: %s\r\nDate: %s\r\n" % (
+                self.version_string().encode("latin-1"),
+                self.date_time_string().encode("latin-1"),
+            ),
+            _JSON_RESPONSE_HEADERS,
+        ]
+        if etag is not None:
+            # Make the browser revalidate on every fetch instead of reusing a stale list
+            response.append(b"ETag: %s\r\nCache-Control: no-cache\r\n" % etag.encode())
+        if gzipped:
+            response.append(b"Content-Encoding: gzip\r\n")
+        response.append(b"Content-Length: %d\r\n\r\n" % len(payload))
+        response.append(payload)
+        self.wfile.write(b"".join(response))
+
+    def copyfile(self, source, outputfile) -> None:
+        """Send static files with socket.sendfile (zero-copy os.sendfile where supported)"""
+        if outputfile is not self.wfile:
+            super().copyfile(source, outputfile)
+            return
+        self.wfile.flush()
+        # Falls back to plain send() itself for file objects without a real fd
+        self.connection.sendfile(source)
+
+    def send_ndjson(self, records: Iterable[dict[str, Any]]) -> None:
+        """Stream records as newline-delimited JSON, writing each one as soon as it is ready"""
+        # No Content-Length: the HTTP/1.0 response body ends when the connection closes
         self.send_response(200)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", "application/x-ndjson")
         self.send_header("Access-Control-Allow-Origin", "http://localhost:8547")
+        self.send_header("Vary", "Accept-Encoding")
+        gzipped = self.accepts_gzip()
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+
+        # GzipFile.flush() emits a sync flush, so each record still reaches the client promptly
+        out = gzip.GzipFile(fileobj=self.wfile, mode='wb', compresslevel=GZIP_LEVEL) if gzipped else self.wfile
+        for record in records:
+            out.write(_json_dumps_line(record))
+            out.flush()
+        if gzipped:
+            out.close()
 
     def log_message(self, format, *args):
         """Suppress default logging"""
         pass
 
 
-def main():
+class HistoryServer(http.server.ThreadingHTTPServer):
+    """Handles each request on its own thread so long backups don't block the UI"""
     # Allow port reuse to avoid "Address already in use" errors
-    socketserver.TCPServer.allow_reuse_address = True
+    allow_reuse_address = True
+    # Don't wait for in-flight requests on Ctrl+C
+    daemon_threads = True
 
+
+def main():
     try:
-        with socketserver.TCPServer(("", PORT), HistoryHandler) as httpd:
+        with HistoryServer(("", PORT), HistoryHandler) as httpd:
             url = f"http://localhost:{PORT}"
             print(f"Claude Code History Viewer")
             print(f"Server running at {url}")
-            print(f"Loading {len(list(CLAUDE_DIR.rglob('*.jsonl')))} session files...")
             print(f"Press Ctrl+C to stop\n")
 
+            # Count session files in the background so a large history doesn't delay startup
+            threading.Thread(
+                target=lambda: print(f"Found {sum(1 for _ in _iter_sessions(CLAUDE_DIR))} session files"),
+                daemon=True,
+            ).start()
+
             # Open browser after server is ready
-            import threading
             threading.Timer(0.5, lambda: webbrowser.open(url)).start()
 
             try:
@@ -111,12 +111,41 @@ export async function getBackups(): Promise<BackupStatusResponse> {
   return response.json();
 }
 
+/**
+ * Read a newline-delimited JSON response one record at a time as it streams in
+ */
+async function* readNdjson<T>(response: Response): AsyncGenerator<T> {
+  if (!response.body) return;
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffered += done ? decoder.decode() : decoder.decode(value, { stream: true });
+    const lines = buffered.split('\n');
+    // Keep the trailing partial line until the rest of it arrives
+    buffered = done ? '' : lines.pop() ?? '';
+    for (const line of lines) {
+      if (line.trim()) yield JSON.parse(line) as T;
+    }
+    if (done) return;
+  }
+}
+
 /**
  * Load sessions from a backup zip (for viewing)
  */
 export async function loadBackup(name: string): Promise<LoadBackupResponse> {
   const response = await fetch(`/api/load-backup?name=${encodeURIComponent(name)}`);
-  return response.json();
+  const sessions: BackupSessionItem[] = [];
+  // Sessions stream in zip order; errors arrive as a record with an `error` field
+  for await (const record of readNdjson<BackupSessionItem & { error?: string }>(response)) {
+    if (record.error) return { error: record.error };
+    sessions.push(record);
+  }
+  // Sort by timestamp, newest first
+  sessions.sort((a, b) => (b.timestamp ?? '').localeCompare(a.timestamp ?? ''));
+  return { sessions, backup_name: name };
 }
 
 interface RestoreResponse {